@@ -54,52 +54,67 @@ def quaternion_from_matrix(matrix: NDArray, isprecise: bool = False) -> np.ndarr
         matrix: rotation matrix to obtain quaternion
         isprecise: if True, input matrix is assumed to be precise rotation matrix and a faster algorithm is used.
     """
-    M = np.array(matrix, dtype=np.float64, copy=False)[:4, :4]
+    return _quaternion_from_matrix_batch(np.asarray(matrix)[None], isprecise=isprecise)[0]
+
+
+def _quaternion_from_matrix_batch(matrices: NDArray, isprecise: bool = False) -> np.ndarray:
+    """Return quaternions from a batch of rotation matrices.
+
+    Args:
+        matrices: array of shape (N, 3, 3) or (N, 4, 4) of rotation matrices
+        isprecise: if True, input matrices are assumed to be precise rotation matrices and a faster algorithm is used.
+
+    Returns:
+        Array of shape (N, 4) of quaternions, with non-negative real part.
+    """
+    M = np.array(matrices, dtype=np.float64, copy=False)[:, :4, :4]
+    m00, m01, m02 = M[:, 0, 0], M[:, 0, 1], M[:, 0, 2]
+    m10, m11, m12 = M[:, 1, 0], M[:, 1, 1], M[:, 1, 2]
+    m20, m21, m22 = M[:, 2, 0], M[:, 2, 1], M[:, 2, 2]
     if isprecise:
-        q = np.empty((4,))
-        t = np.trace(M)
-        if t > M[3, 3]:
-            q[0] = t
-            q[3] = M[1, 0] - M[0, 1]
-            q[2] = M[0, 2] - M[2, 0]
-            q[1] = M[2, 1] - M[1, 2]
-        else:
-            i, j, k = 1, 2, 3
-            if M[1, 1] > M[0, 0]:
-                i, j, k = 2, 3, 1
-            if M[2, 2] > M[i, i]:
-                i, j, k = 3, 1, 2
-            t = M[i, i] - (M[j, j] + M[k, k]) + M[3, 3]
-            q[i] = t
-            q[j] = M[i, j] + M[j, i]
-            q[k] = M[k, i] + M[i, k]
-            q[3] = M[k, j] - M[j, k]
-        q *= 0.5 / math.sqrt(t * M[3, 3])
+        m33 = M[:, 3, 3] if M.shape[1] > 3 and M.shape[2] > 3 else np.ones_like(m00)
+        # One candidate quaternion per pivot (w, x, y, z), each exact but best conditioned when its pivot t is
+        # largest. Select the pivot with argmax instead of branching per matrix.
+        ts = np.stack(
+            [
+                m00 + m11 + m22 + m33,
+                m00 - m11 - m22 + m33,
+                m11 - m00 - m22 + m33,
+                m22 - m00 - m11 + m33,
+            ],
+            axis=-1,
+        )
+        candidates = np.stack(
+            [
+                np.stack([ts[:, 0], m21 - m12, m02 - m20, m10 - m01], axis=-1),
+                np.stack([m21 - m12, ts[:, 1], m01 + m10, m02 + m20], axis=-1),
+                np.stack([m02 - m20, m01 + m10, ts[:, 2], m12 + m21], axis=-1),
+                np.stack([m10 - m01, m02 + m20, m12 + m21, ts[:, 3]], axis=-1),
+            ],
+            axis=1,
+        )
+        pivot = np.argmax(ts, axis=-1)[:, None]
+        t = np.take_along_axis(ts, pivot, axis=-1)
+        q = np.take_along_axis(candidates, pivot[..., None], axis=1)[:, 0]
+        q *= 0.5 / np.sqrt(t * m33[:, None])
     else:
-        m00 = M[0, 0]
-        m01 = M[0, 1]
-        m02 = M[0, 2]
-        m10 = M[1, 0]
-        m11 = M[1, 1]
-        m12 = M[1, 2]
-        m20 = M[2, 0]
-        m21 = M[2, 1]
-        m22 = M[2, 2]
         # symmetric matrix K
-        K = [
-            [m00 - m11 - m22, 0.0, 0.0, 0.0],
-            [m01 + m10, m11 - m00 - m22, 0.0, 0.0],
-            [m02 + m20, m12 + m21, m22 - m00 - m11, 0.0],
-            [m21 - m12, m02 - m20, m10 - m01, m00 + m11 + m22],
-        ]
-        K = np.array(K)
+        K = np.zeros((M.shape[0], 4, 4), dtype=np.float64)
+        K[:, 0, 0] = m00 - m11 - m22
+        K[:, 1, 0] = m01 + m10
+        K[:, 1, 1] = m11 - m00 - m22
+        K[:, 2, 0] = m02 + m20
+        K[:, 2, 1] = m12 + m21
+        K[:, 2, 2] = m22 - m00 - m11
+        K[:, 3, 0] = m21 - m12
+        K[:, 3, 1] = m02 - m20
+        K[:, 3, 2] = m10 - m01
+        K[:, 3, 3] = m00 + m11 + m22
         K /= 3.0
         # quaternion is eigenvector of K that corresponds to largest eigenvalue
         w, V = np.linalg.eigh(K)
-        q = V[np.array([3, 0, 1, 2]), np.argmax(w)]
-    if q[0] < 0.0:
-        np.negative(q, q)
-    return q
+        q = np.take_along_axis(V, np.argmax(w, axis=-1)[:, None, None], axis=-1)[:, [3, 0, 1, 2], 0]
+    return np.where(q[:, :1] < 0.0, -q, q)
 
 
 def quaternion_slerp(
@@ -160,33 +175,103 @@ def quaternion_matrix(quaternion: NDArray) -> np.ndarray:
     )
 
 
-def get_interpolated_poses(pose_a: NDArray, pose_b: NDArray, steps: int = 10) -> List[float]:
+def _quaternion_slerp_batch(quat0: NDArray, quat1: NDArray, fractions: NDArray) -> np.ndarray:
+    """Return spherical linear interpolation between pairs of quaternions for many fractions at once.
+
+    Vectorized equivalent of calling :func:`quaternion_slerp` (with ``spin=0`` and ``shortestpath=True``)
+    once per pair of quaternions and fraction.
+
+    Args:
+        quat0: first quaternions, of shape (..., 4)
+        quat1: second quaternions, of shape (..., 4)
+        fractions: array of interpolation amounts between quat0 (0) and quat1 (1)
+
+    Returns:
+        Array of shape (..., len(fractions), 4) with the interpolated quaternions.
+    """
+    q0 = np.array(quat0, dtype=np.float64, copy=True)[..., :4]
+    q1 = np.array(quat1, dtype=np.float64, copy=True)[..., :4]
+    q0 /= np.linalg.norm(q0, axis=-1, keepdims=True)
+    q1 /= np.linalg.norm(q1, axis=-1, keepdims=True)
+    fractions = np.asarray(fractions, dtype=np.float64)
+
+    d = np.sum(q0 * q1, axis=-1)
+    # invert rotation to take the shortest path
+    q1 = np.where(d[..., None] < 0.0, -q1, q1)
+    d = np.abs(d)
+    angle = np.arccos(np.clip(d, -1.0, 1.0))
+    # nearly identical rotations are not interpolated
+    degenerate = (np.abs(d - 1.0) < _EPS) | (np.abs(angle) < _EPS)
+    isin = 1.0 / np.sin(np.where(degenerate, 1.0, angle))
+
+    angle = angle[..., None]
+    s0 = np.sin((1.0 - fractions) * angle) * isin[..., None]
+    s1 = np.sin(fractions * angle) * isin[..., None]
+    s0 = np.where(degenerate[..., None], 1.0, s0)
+    s1 = np.where(degenerate[..., None], 0.0, s1)
+    # Match the exact endpoints returned by quaternion_slerp.
+    s0[..., fractions == 0.0] = 1.0
+    s1[..., fractions == 0.0] = 0.0
+    s0[..., fractions == 1.0] = 0.0
+    s1[..., fractions == 1.0] = 1.0
+    return s0[..., None] * q0[..., None, :] + s1[..., None] * q1[..., None, :]
+
+
+def _quaternion_matrix_batch(quaternions: NDArray) -> np.ndarray:
+    """Return rotation matrices from a batch of quaternions.
+
+    Vectorized equivalent of ``quaternion_matrix(q)[:3, :3]`` for each quaternion.
+
+    Args:
+        quaternions: array of shape (..., 4) of quaternions to convert
+
+    Returns:
+        Array of shape (..., 3, 3) of rotation matrices.
+    """
+    q = np.array(quaternions, dtype=np.float64, copy=True)
+    n = np.sum(q * q, axis=-1, keepdims=True)
+    valid = n >= _EPS
+    q *= np.where(valid, np.sqrt(2.0 / np.where(valid, n, 1.0)), 0.0)
+    q = q[..., :, None] * q[..., None, :]
+    mats = np.empty(q.shape[:-2] + (3, 3), dtype=np.float64)
+    mats[..., 0, 0] = 1.0 - q[..., 2, 2] - q[..., 3, 3]
+    mats[..., 0, 1] = q[..., 1, 2] - q[..., 3, 0]
+    mats[..., 0, 2] = q[..., 1, 3] + q[..., 2, 0]
+    mats[..., 1, 0] = q[..., 1, 2] + q[..., 3, 0]
+    mats[..., 1, 1] = 1.0 - q[..., 1, 1] - q[..., 3, 3]
+    mats[..., 1, 2] = q[..., 2, 3] - q[..., 1, 0]
+    mats[..., 2, 0] = q[..., 1, 3] - q[..., 2, 0]
+    mats[..., 2, 1] = q[..., 2, 3] + q[..., 1, 0]
+    mats[..., 2, 2] = 1.0 - q[..., 1, 1] - q[..., 2, 2]
+    return mats
+
+
+def get_interpolated_poses(pose_a: NDArray, pose_b: NDArray, steps: int = 10) -> np.ndarray:
     """Return interpolation of poses with specified number of steps.
     Args:
         pose_a: first pose
         pose_b: second pose
         steps: number of steps the interpolated pose path should contain
+
+    Returns:
+        Array of shape (steps, 3, 4) with the interpolated poses.
     """
 
     quat_a = quaternion_from_matrix(pose_a[:3, :3])
     quat_b = quaternion_from_matrix(pose_b[:3, :3])
 
     ts = np.linspace(0, 1, steps)
-    quats = [quaternion_slerp(quat_a, quat_b, t) for t in ts]
-    trans = [(1 - t) * pose_a[:3, 3] + t * pose_b[:3, 3] for t in ts]
-
-    poses_ab = []
-    for quat, tran in zip(quats, trans):
-        pose = np.identity(4)
-        pose[:3, :3] = quaternion_matrix(quat)[:3, :3]
-        pose[:3, 3] = tran
-        poses_ab.append(pose[:3])
+    quats = _quaternion_slerp_batch(quat_a, quat_b, ts)
+
+    poses_ab = np.empty((steps, 3, 4), dtype=np.float64)
+    poses_ab[:, :3, :3] = _quaternion_matrix_batch(quats)
+    poses_ab[:, :3, 3] = (1 - ts)[:, None] * pose_a[:3, 3] + ts[:, None] * pose_b[:3, 3]
     return poses_ab
 
 
 def get_interpolated_k(
     k_a: Float[Tensor, "3 3"], k_b: Float[Tensor, "3 3"], steps: int = 10
-) -> List[Float[Tensor, "3 4"]]:
+) -> List[Float[Tensor, "3 3"]]:
     """
     Returns interpolated path between two camera poses with specified number of steps.
 
@@ -259,23 +344,26 @@ def get_interpolated_poses_many(
     Returns:
         tuple of new poses and intrinsics
     """
-    traj = []
-    k_interp = []
-
     if order_poses:
         poses, Ks = get_ordered_poses_and_k(poses, Ks)
 
-    for idx in range(poses.shape[0] - 1):
-        pose_a = poses[idx].cpu().numpy()
-        pose_b = poses[idx + 1].cpu().numpy()
-        poses_ab = get_interpolated_poses(pose_a, pose_b, steps=steps_per_transition)
-        traj += poses_ab
-        k_interp += get_interpolated_k(Ks[idx], Ks[idx + 1], steps=steps_per_transition)
+    poses_np = poses.cpu().numpy()
+    quats = _quaternion_from_matrix_batch(poses_np[:, :3, :3])
+    ts = np.linspace(0, 1, steps_per_transition)
 
-    traj = np.stack(traj, axis=0)
-    k_interp = torch.stack(k_interp, dim=0)
+    # interpolate all consecutive pairs of poses at once, shape (num_poses - 1, steps_per_transition, ...)
+    quats_interp = _quaternion_slerp_batch(quats[:-1], quats[1:], ts)
+    traj = np.empty(quats_interp.shape[:-1] + (3, 4), dtype=np.float64)
+    traj[..., :3] = _quaternion_matrix_batch(quats_interp)
+    traj[..., 3] = (1 - ts)[None, :, None] * poses_np[:-1, None, :3, 3] + ts[None, :, None] * poses_np[1:, None, :3, 3]
 
-    return torch.tensor(traj, dtype=torch.float32), torch.tensor(k_interp, dtype=torch.float32)
+    ts_k = torch.from_numpy(ts).to(Ks)[None, :, None, None]
+    k_interp = Ks[:-1, None] * (1.0 - ts_k) + Ks[1:, None] * ts_k
+
+    return (
+        torch.tensor(traj.reshape(-1, 3, 4), dtype=torch.float32),
+        k_interp.reshape(-1, 3, 3).to(torch.float32),
+    )
 
 
 def normalize(x: torch.Tensor) -> Float[Tensor, "*batch"]:
@@ -294,7 +382,7 @@ def normalize_with_norm(x: torch.Tensor, dim: int) -> Tuple[torch.Tensor, torch.
         Tuple of normalized tensor and corresponding norm.
     """
 
-    norm = torch.maximum(torch.linalg.vector_norm(x, dim=dim, keepdims=True), torch.tensor([_EPS]).to(x))
+    norm = torch.clamp(torch.linalg.vector_norm(x, dim=dim, keepdims=True), min=_EPS)
     return x / norm, norm
 
 
@@ -346,7 +434,12 @@ def _compute_residual_and_jacobian(
     y: torch.Tensor,
     xd: torch.Tensor,
     yd: torch.Tensor,
-    distortion_params: torch.Tensor,
+    k1: torch.Tensor,
+    k2: torch.Tensor,
+    k3: torch.Tensor,
+    k4: torch.Tensor,
+    p1: torch.Tensor,
+    p2: torch.Tensor,
 ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor,]:
     """Auxiliary function of radial_and_tangential_undistort() that computes residuals and jacobians.
     Adapted from MultiNeRF:
@@ -357,19 +450,17 @@ def _compute_residual_and_jacobian(
         y: The updated y coordinates.
         xd: The distorted x coordinates.
         yd: The distorted y coordinates.
-        distortion_params: The distortion parameters [k1, k2, k3, k4, p1, p2].
+        k1: The first radial distortion parameter.
+        k2: The second radial distortion parameter.
+        k3: The third radial distortion parameter.
+        k4: The fourth radial distortion parameter.
+        p1: The first tangential distortion parameter.
+        p2: The second tangential distortion parameter.
 
     Returns:
         The residuals (fx, fy) and jacobians (fx_x, fx_y, fy_x, fy_y).
     """
 
-    k1 = distortion_params[..., 0]
-    k2 = distortion_params[..., 1]
-    k3 = distortion_params[..., 2]
-    k4 = distortion_params[..., 3]
-    p1 = distortion_params[..., 4]
-    p2 = distortion_params[..., 5]
-
     # let r(x, y) = x^2 + y^2;
     #     d(x, y) = 1 + k1 * r(x, y) + k2 * r(x, y) ^2 + k3 * r(x, y)^3 +
     #                   k4 * r(x, y)^4;
@@ -387,8 +478,9 @@ def _compute_residual_and_jacobian(
     #
     # We are looking for a solution that satisfies
     # fx(x, y) = fy(x, y) = 0;
-    fx = d * x + 2 * p1 * x * y + p2 * (r + 2 * x * x) - xd
-    fy = d * y + 2 * p2 * x * y + p1 * (r + 2 * y * y) - yd
+    two_xy = 2.0 * x * y
+    fx = d * x + p1 * two_xy + p2 * (r + 2 * x * x) - xd
+    fy = d * y + p2 * two_xy + p1 * (r + 2 * y * y) - yd
 
     # Compute derivative of d over [x, y]
     d_r = k1 + r * (2.0 * k2 + r * (3.0 * k3 + r * 4.0 * k4))
@@ -427,22 +519,37 @@ def radial_and_tangential_undistort(
         The undistorted coordinates.
     """
 
+    xd = coords[..., 0]
+    yd = coords[..., 1]
+    k1 = distortion_params[..., 0]
+    k2 = distortion_params[..., 1]
+    k3 = distortion_params[..., 2]
+    k4 = distortion_params[..., 3]
+    p1 = distortion_params[..., 4]
+    p2 = distortion_params[..., 5]
+
     # Initialize from the distorted point.
-    x = coords[..., 0]
-    y = coords[..., 1]
+    x = xd
+    y = yd
 
+    # Coordinates whose newton step falls below float32 resolution are frozen. The mask stays on the device,
+    # so no host sync is needed, at the cost of still evaluating every coordinate for the fixed iteration count.
+    converged = torch.zeros_like(xd, dtype=torch.bool)
     for _ in range(max_iterations):
         fx, fy, fx_x, fx_y, fy_x, fy_y = _compute_residual_and_jacobian(
-            x=x, y=y, xd=coords[..., 0], yd=coords[..., 1], distortion_params=distortion_params
+            x=x, y=y, xd=xd, yd=yd, k1=k1, k2=k2, k3=k3, k4=k4, p1=p1, p2=p2
         )
         denominator = fy_x * fx_y - fx_x * fy_y
         x_numerator = fx * fy_y - fy * fx_y
         y_numerator = fy * fx_x - fx * fy_x
-        step_x = torch.where(torch.abs(denominator) > eps, x_numerator / denominator, torch.zeros_like(denominator))
-        step_y = torch.where(torch.abs(denominator) > eps, y_numerator / denominator, torch.zeros_like(denominator))
+        valid = (torch.abs(denominator) > eps) & ~converged
+        zeros = torch.zeros_like(denominator)
+        step_x = torch.where(valid, x_numerator / denominator, zeros)
+        step_y = torch.where(valid, y_numerator / denominator, zeros)
 
         x = x + step_x
         y = y + step_y
+        converged = converged | (step_x * step_x + step_y * step_y < 1e-14)
 
     return torch.stack([x, y], dim=-1)
 
@@ -462,17 +569,22 @@ def rotation_matrix(a: Float[Tensor, "3"], b: Float[Tensor, "3"]) -> Float[Tenso
     c = torch.dot(a, b)
     # If vectors are exactly opposite, we add a little noise to one of them
     if c < -1 + 1e-8:
-        eps = (torch.rand(3) - 0.5) * 0.01
+        eps = (torch.rand(3, device=a.device, dtype=a.dtype) - 0.5) * 0.01
         return rotation_matrix(a + eps, b)
     s = torch.linalg.norm(v)
-    skew_sym_mat = torch.Tensor(
+    zero = torch.zeros((), device=v.device, dtype=v.dtype)
+    skew_sym_mat = torch.stack(
         [
-            [0, -v[2], v[1]],
-            [v[2], 0, -v[0]],
-            [-v[1], v[0], 0],
+            torch.stack([zero, -v[2], v[1]]),
+            torch.stack([v[2], zero, -v[0]]),
+            torch.stack([-v[1], v[0], zero]),
         ]
     )
-    return torch.eye(3) + skew_sym_mat + skew_sym_mat @ skew_sym_mat * ((1 - c) / (s**2 + 1e-8))
+    return (
+        torch.eye(3, device=v.device, dtype=v.dtype)
+        + skew_sym_mat
+        + skew_sym_mat @ skew_sym_mat * ((1 - c) / (s**2 + 1e-8))
+    )
 
 
 def focus_of_attention(poses: Float[Tensor, "*num_poses 4 4"], initial_focus: Float[Tensor, "3"]) -> Float[Tensor, "3"]:
@@ -607,7 +719,7 @@ def auto_orient_and_center_poses(
                 # re-normalize
                 up = up / torch.linalg.norm(up)
 
-        rotation = rotation_matrix(up, torch.Tensor([0, 0, 1]))
+        rotation = rotation_matrix(up, torch.tensor([0.0, 0.0, 1.0], device=up.device, dtype=up.dtype))
         transform = torch.cat([rotation, rotation @ -translation[..., None]], dim=-1)
         oriented_poses = transform @ poses
     elif method == "none":
@@ -15,11 +15,11 @@
 """
 Some ray datastructures.
 """
-import random
 from dataclasses import dataclass
 from typing import Callable, Dict, Optional, Tuple, Union
 
 import torch
+import torch.nn.functional as F
 from jaxtyping import Float, Int, Shaped
 from torch import Tensor
 
@@ -136,13 +136,11 @@ class RaySamples(TensorDataclass):
         """
 
         delta_density = self.deltas * densities
-        alphas = 1 - torch.exp(-delta_density)
+        alphas = -torch.expm1(-delta_density)
 
+        # Exclusive cumsum, padding with a leading zero directly rather than allocating and concatenating one.
         transmittance = torch.cumsum(delta_density[..., :-1, :], dim=-2)
-        transmittance = torch.cat(
-            [torch.zeros((*transmittance.shape[:1], 1, 1), device=densities.device), transmittance], dim=-2
-        )
-        transmittance = torch.exp(-transmittance)  # [..., "num_samples"]
+        transmittance = torch.exp(-F.pad(transmittance, (0, 0, 1, 0)))  # [..., "num_samples"]
 
         weights = alphas * transmittance  # [..., "num_samples"]
         weights = torch.nan_to_num(weights)
@@ -199,7 +197,9 @@ class RayBundle(TensorDataclass):
         Args:
             camera_index: Camera index.
         """
-        self.camera_indices = torch.ones_like(self.origins[..., 0:1]).long() * camera_index
+        self.camera_indices = torch.full(
+            (*self.origins.shape[:-1], 1), camera_index, dtype=torch.long, device=self.origins.device
+        )
 
     def __len__(self) -> int:
         num_rays = torch.numel(self.origins) // self.origins.shape[-1]
@@ -215,8 +215,8 @@ class RayBundle(TensorDataclass):
             RayBundle with subset of rays.
         """
         assert num_rays <= len(self)
-        indices = random.sample(range(len(self)), k=num_rays)
-        return self[indices]
+        indices = torch.randperm(len(self), device=self.origins.device)[:num_rays]
+        return self.flatten()[indices]
 
     def get_row_major_sliced_ray_bundle(self, start_idx: int, end_idx: int) -> "RayBundle":
         """Flattens RayBundle and extracts chunk given start and end indices.
@@ -302,6 +302,9 @@ class VanillaDataManagerConfig(DataManagerConfig):
     train_num_times_to_repeat_images: int = -1
     """When not training on all images, number of iterations before picking new
     images. If -1, never pick new images."""
+    train_prefetch_next_images: bool = False
+    """When periodically picking new training images, load the next set in a
+    background thread so training does not stall. Doubles the image cache memory."""
     eval_num_rays_per_batch: int = 1024
     """Number of rays per batch to use per eval iteration."""
     eval_num_images_to_sample_from: int = -1
@@ -436,6 +439,7 @@ class VanillaDataManager(DataManager, Generic[TDataset]):  # pylint: disable=abs
             num_workers=self.world_size * 4,
             pin_memory=True,
             collate_fn=self.config.collate_fn,
+            prefetch_next_images=self.config.train_prefetch_next_images,
         )
         self.iter_train_image_dataloader = iter(self.train_image_dataloader)
         self.train_pixel_sampler = self._get_pixel_sampler(self.train_dataset, self.config.train_num_rays_per_batch)
@@ -487,6 +491,8 @@ class VanillaDataManager(DataManager, Generic[TDataset]):  # pylint: disable=abs
         image_batch = next(self.iter_train_image_dataloader)
         assert self.train_pixel_sampler is not None
         batch = self.train_pixel_sampler.sample(image_batch)
+        # move the sampled pixels once, rather than in each of the model's metric and loss functions
+        batch["image"] = batch["image"].to(self.device)
         ray_indices = batch["indices"]
         ray_bundle = self.train_ray_generator(ray_indices)
         return ray_bundle, batch
@@ -497,6 +503,8 @@ class VanillaDataManager(DataManager, Generic[TDataset]):  # pylint: disable=abs
         image_batch = next(self.iter_eval_image_dataloader)
         assert self.eval_pixel_sampler is not None
         batch = self.eval_pixel_sampler.sample(image_batch)
+        # see next_train
+        batch["image"] = batch["image"].to(self.device)
         ray_indices = batch["indices"]
         ray_bundle = self.eval_ray_generator(ray_indices)
         return ray_bundle, batch
@@ -19,9 +19,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Type
 
-import imageio
 import numpy as np
 import torch
+from PIL import Image
 
 from nerfstudio.cameras.cameras import Cameras, CameraType
 from nerfstudio.data.dataparsers.base_dataparser import (
@@ -74,13 +74,13 @@ class DNeRF(DataParser):
         for frame in meta["frames"]:
             fname = self.data / Path(frame["file_path"].replace("./", "") + ".png")
             image_filenames.append(fname)
-            poses.append(np.array(frame["transform_matrix"]))
+            poses.append(frame["transform_matrix"])
             times.append(frame["time"])
-        poses = np.array(poses).astype(np.float32)
+        poses = np.array(poses, dtype=np.float32)
         times = torch.tensor(times, dtype=torch.float32)
 
-        img_0 = imageio.imread(image_filenames[0])
-        image_height, image_width = img_0.shape[:2]
+        with Image.open(image_filenames[0]) as img:
+            image_width, image_height = img.size
         camera_angle_x = float(meta["camera_angle_x"])
         focal_length = 0.5 * image_width / np.tan(0.5 * camera_angle_x)
 
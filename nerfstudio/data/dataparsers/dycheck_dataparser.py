@@ -23,6 +23,7 @@ from typing import Dict, List, Tuple, Type
 import cv2
 import numpy as np
 import torch
+from PIL import Image
 
 from nerfstudio.cameras.cameras import Cameras, CameraType
 from nerfstudio.data.dataparsers.base_dataparser import (
@@ -316,7 +317,8 @@ class Dycheck(DataParser):
         d = self.config.downscale_factor
         if not image_filenames[0].exists():
             CONSOLE.print(f"downscale factor {d}x not exist, converting")
-            ori_h, ori_w = cv2.imread(str(self.data / f"rgb/1x/{frame_names[0]}.png")).shape[:2]
+            with Image.open(self.data / f"rgb/1x/{frame_names[0]}.png") as img:
+                ori_w, ori_h = img.size
             (self.data / f"rgb/{d}x").mkdir(exist_ok=True)
             h, w = ori_h // d, ori_w // d
             for frame in frame_names:
@@ -20,9 +20,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, Tuple, Type
 
-import imageio
 import numpy as np
 import torch
+from PIL import Image
 
 from nerfstudio.cameras import camera_utils
 from nerfstudio.cameras.cameras import Cameras, CameraType
@@ -76,8 +76,8 @@ class InstantNGP(DataParser):
                 num_skipped_image_filenames += 1
             else:
                 if "w" not in meta:
-                    img_0 = imageio.imread(fname)
-                    h, w = img_0.shape[:2]
+                    with Image.open(fname) as img:
+                        w, h = img.size
                     meta["w"] = w
                     if "h" in meta:
                         meta_h = meta["h"]
@@ -85,7 +85,7 @@ class InstantNGP(DataParser):
                     else:
                         meta["h"] = h
                 image_filenames.append(fname)
-                poses.append(np.array(frame["transform_matrix"]))
+                poses.append(frame["transform_matrix"])
                 if "mask_path" in frame:
                     mask_fname = data_dir / Path(frame["mask_path"])
                     mask_filenames.append(mask_fname)
@@ -97,7 +97,7 @@ class InstantNGP(DataParser):
         No image files found. 
         You should check the file_paths in the transforms.json file to make sure they are correct.
         """
-        poses = np.array(poses).astype(np.float32)
+        poses = np.array(poses, dtype=np.float32)
         poses[:, :3, 3] *= self.config.scene_scale
 
         camera_to_world = torch.from_numpy(poses[:, :3])  # camera to world transform
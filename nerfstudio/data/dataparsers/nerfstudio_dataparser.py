@@ -18,7 +18,7 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, Optional, Type
+from typing import Any, Dict, Literal, Optional, Type
 
 import numpy as np
 import torch
@@ -70,6 +70,7 @@ class Nerfstudio(DataParser):
 
     config: NerfstudioDataParserConfig
     downscale_factor: Optional[int] = None
+    meta: Optional[Dict[str, Any]] = None
 
     def _generate_dataparser_outputs(self, split="train"):
         # pylint: disable=too-many-statements
@@ -77,11 +78,14 @@ class Nerfstudio(DataParser):
         assert self.config.data.exists(), f"Data directory {self.config.data} does not exist."
 
         if self.config.data.suffix == ".json":
-            meta = load_from_json(self.config.data)
+            transforms_path = self.config.data
             data_dir = self.config.data.parent
         else:
-            meta = load_from_json(self.config.data / "transforms.json")
+            transforms_path = self.config.data / "transforms.json"
             data_dir = self.config.data
+        if self.meta is None:
+            self.meta = load_from_json(transforms_path)
+        meta = self.meta
 
         image_filenames = []
         mask_filenames = []
@@ -146,7 +150,7 @@ class Nerfstudio(DataParser):
                 )
 
             image_filenames.append(fname)
-            poses.append(np.array(frame["transform_matrix"]))
+            poses.append(frame["transform_matrix"])
             if "mask_path" in frame:
                 mask_filepath = Path(frame["mask_path"])
                 mask_fname = self._get_fname(
@@ -219,7 +223,7 @@ class Nerfstudio(DataParser):
         else:
             orientation_method = self.config.orientation_method
 
-        poses = torch.from_numpy(np.array(poses).astype(np.float32))
+        poses = torch.from_numpy(np.array(poses, dtype=np.float32))
         poses, transform_matrix = camera_utils.auto_orient_and_center_poses(
             poses,
             method=orientation_method,
@@ -35,6 +35,7 @@ from nerfstudio.data.scene_box import SceneBox
 # TODO(1480) use pycolmap instead of colmap_parsing_utils
 # import pycolmap
 from nerfstudio.data.utils.colmap_parsing_utils import (
+    qvec2rotmat,
     read_cameras_binary,
     read_images_binary,
 )
@@ -90,11 +91,9 @@ class Phototourism(DataParser):
             cams = read_cameras_binary(self.data / "dense/sparse/cameras.bin")
             imgs = read_images_binary(self.data / "dense/sparse/images.bin")
 
-        poses = []
-        fxs = []
-        fys = []
-        cxs = []
-        cys = []
+        qvecs = []
+        tvecs = []
+        intrinsics = []
         image_filenames = []
 
         flip = torch.eye(3)
@@ -106,22 +105,22 @@ class Phototourism(DataParser):
 
             assert cam.model == "PINHOLE", "Only pinhole (perspective) camera model is supported at the moment"
 
-            pose = torch.cat([torch.tensor(img.qvec2rotmat()), torch.tensor(img.tvec.reshape(3, 1))], dim=1)
-            pose = torch.cat([pose, torch.tensor([[0.0, 0.0, 0.0, 1.0]])], dim=0)
-            poses.append(torch.linalg.inv(pose))
-            fxs.append(torch.tensor(cam.params[0]))
-            fys.append(torch.tensor(cam.params[1]))
-            cxs.append(torch.tensor(cam.params[2]))
-            cys.append(torch.tensor(cam.params[3]))
+            qvecs.append(img.qvec)
+            tvecs.append(img.tvec)
+            intrinsics.append(cam.params[:4])
 
             image_filenames.append(self.data / "dense/images" / img.name)
 
-        poses = torch.stack(poses).float()
+        # colmap stores world-to-camera transforms. Invert them all at once, using the closed form inverse of a rigid
+        # transform [R | t] -> [R^T | -R^T t] instead of a general matrix inverse.
+        rotations_t = np.swapaxes(qvec2rotmat(np.array(qvecs)), -1, -2)
+        poses = np.zeros((len(rotations_t), 4, 4))
+        poses[:, :3, :3] = rotations_t
+        poses[:, :3, 3] = -np.einsum("bij,bj->bi", rotations_t, np.array(tvecs))
+        poses[:, 3, 3] = 1.0
+        poses = torch.from_numpy(poses.astype(np.float32))
         poses[..., 1:3] *= -1
-        fxs = torch.stack(fxs).float()
-        fys = torch.stack(fys).float()
-        cxs = torch.stack(cxs).float()
-        cys = torch.stack(cys).float()
+        fxs, fys, cxs, cys = torch.from_numpy(np.array(intrinsics, dtype=np.float32).T.copy())
 
         # filter image_filenames and poses based on train/eval split percentage
         num_images = len(image_filenames)
@@ -79,10 +79,8 @@ class SDFStudio(DataParser):
         cx = []
         cy = []
         camera_to_worlds = []
-        for i, frame in enumerate(meta["frames"]):
-            if i not in indices:
-                continue
-
+        for i in indices:
+            frame = meta["frames"][i]
             image_filename = self.config.data / frame["rgb_path"]
             depth_filename = frame.get("mono_depth_path")
             normal_filename = frame.get("mono_normal_path")
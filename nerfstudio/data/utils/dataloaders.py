@@ -46,6 +46,8 @@ class CacheDataloader(DataLoader):
         num_times_to_repeat_images: How often to collate new images. -1 to never pick new images.
         device: Device to perform computation.
         collate_fn: The function we will use to collate our training data
+        prefetch_next_images: Whether to load the next set of images in a background thread while the current
+            one is in use. Doubles the memory used by the image cache.
     """
 
     def __init__(
@@ -55,6 +57,7 @@ class CacheDataloader(DataLoader):
         num_times_to_repeat_images: int = -1,
         device: Union[torch.device, str] = "cpu",
         collate_fn=nerfstudio_collate,
+        prefetch_next_images: bool = False,
         **kwargs,
     ):
         self.dataset = dataset
@@ -70,6 +73,14 @@ class CacheDataloader(DataLoader):
         self.first_time = True
 
         self.cached_collated_batch = None
+        # only worth prefetching if new images are picked periodically
+        self.prefetch_next_images = (
+            prefetch_next_images and not self.cache_all_images and self.num_times_to_repeat_images > 0
+        )
+        self.prefetch_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.prefetched_batch: Optional[concurrent.futures.Future] = None
+        if self.prefetch_next_images:
+            self.prefetch_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         if self.cache_all_images:
             CONSOLE.print(f"Caching all {len(self.dataset)} images.")
             if len(self.dataset) > 500:
@@ -90,8 +101,12 @@ class CacheDataloader(DataLoader):
     def __getitem__(self, idx):
         return self.dataset.__getitem__(idx)
 
-    def _get_batch_list(self):
-        """Returns a list of batches from the dataset attribute."""
+    def _get_batch_list(self, show_progress: bool = True):
+        """Returns a list of batches from the dataset attribute.
+
+        Args:
+            show_progress: Whether to display a progress bar while loading.
+        """
 
         indices = random.sample(range(len(self.dataset)), k=self.num_images_to_sample_from)
         batch_list = []
@@ -106,14 +121,16 @@ class CacheDataloader(DataLoader):
                 res = executor.submit(self.dataset.__getitem__, idx)
                 results.append(res)
 
-            for res in track(results, description="Loading data batch", transient=True):
+            if show_progress:
+                results = track(results, description="Loading data batch", transient=True)
+            for res in results:
                 batch_list.append(res.result())
 
         return batch_list
 
-    def _get_collated_batch(self):
+    def _get_collated_batch(self, show_progress: bool = True):
         """Returns a collated batch."""
-        batch_list = self._get_batch_list()
+        batch_list = self._get_batch_list(show_progress=show_progress)
         collated_batch = self.collate_fn(batch_list)
         collated_batch = get_dict_to_torch(collated_batch, device=self.device, exclude=["image"])
         return collated_batch
@@ -127,7 +144,13 @@ class CacheDataloader(DataLoader):
             ):
                 # trigger a reset
                 self.num_repeated = 0
-                collated_batch = self._get_collated_batch()
+                if self.prefetched_batch is not None:
+                    collated_batch = self.prefetched_batch.result()
+                else:
+                    collated_batch = self._get_collated_batch()
+                if self.prefetch_executor is not None:
+                    # a progress bar from the background thread would clash with other live displays
+                    self.prefetched_batch = self.prefetch_executor.submit(self._get_collated_batch, False)
                 # possibly save a cached item
                 self.cached_collated_batch = collated_batch if self.num_times_to_repeat_images != 0 else None
                 self.first_time = False
@@ -180,8 +203,16 @@ class EvalDataloader(DataLoader):
         Args:
             image_idx: Camera image index
         """
+        return self._get_data_from_loaded_image(image_idx, self.input_dataset[image_idx])
+
+    def _get_data_from_loaded_image(self, image_idx: int, batch: Dict) -> Tuple[RayBundle, Dict]:
+        """Returns the data for a specific image index, given the item already loaded from the dataset.
+
+        Args:
+            image_idx: Camera image index
+            batch: The dataset item for the image index
+        """
         ray_bundle = self.cameras.generate_rays(camera_indices=image_idx, keep_shape=True)
-        batch = self.input_dataset[image_idx]
         batch = get_dict_to_torch(batch, device=self.device, exclude=["image"])
         return ray_bundle, batch
 
@@ -189,6 +220,8 @@ class EvalDataloader(DataLoader):
 class FixedIndicesEvalDataloader(EvalDataloader):
     """Dataloader that returns a fixed set of indices.
 
+    While an image is being rendered, the next image is loaded from disk on a background thread.
+
     Args:
         input_dataset: InputDataset to load data from
         image_indices: List of image indices to load data from. If None, then use all images.
@@ -208,19 +241,46 @@ class FixedIndicesEvalDataloader(EvalDataloader):
         else:
             self.image_indices = image_indices
         self.count = 0
+        self.executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self.prefetched: Optional[concurrent.futures.Future] = None
+
+    def _shutdown_executor(self):
+        """Cancels any pending prefetch and stops the background thread."""
+        if self.prefetched is not None:
+            self.prefetched.cancel()
+        self.prefetched = None
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+        self.executor = None
 
     def __iter__(self):
         self.count = 0
+        self._shutdown_executor()
         return self
 
     def __next__(self):
         if self.count < len(self.image_indices):
             image_idx = self.image_indices[self.count]
-            ray_bundle, batch = self.get_data_from_image_idx(image_idx)
+            if self.prefetched is not None:
+                batch = self.prefetched.result()
+            else:
+                batch = self.input_dataset[image_idx]
             self.count += 1
-            return ray_bundle, batch
+            if self.count < len(self.image_indices):
+                if self.executor is None:
+                    self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                self.prefetched = self.executor.submit(self.input_dataset.__getitem__, self.image_indices[self.count])
+            else:
+                # last image, nothing left to prefetch
+                self._shutdown_executor()
+            return self._get_data_from_loaded_image(image_idx, batch)
         raise StopIteration
 
+    def __del__(self):
+        # __init__ may not have completed
+        if getattr(self, "executor", None) is not None:
+            self._shutdown_executor()
+
 
 class RandIndicesEvalDataloader(EvalDataloader):
     """Dataloader that returns random images.
@@ -18,6 +18,7 @@ Optimizers class.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from inspect import signature
 from typing import Any, Dict, List, Optional, Type
 
 import torch
@@ -41,6 +42,14 @@ class OptimizerConfig(base_config.PrintableConfig):
     """The epsilon value to use."""
     max_norm: Optional[float] = None
     """The max norm to use for gradient clipping."""
+    foreach: Optional[bool] = None
+    """Whether to use the multi-tensor (foreach) implementation of the optimizer, which updates all parameters of
+    a group with a handful of kernel launches instead of several per parameter. None uses the pytorch default, and
+    the setting is ignored by optimizers that do not accept it."""
+    fused: bool = False
+    """Whether to use the fused implementation of the optimizer, which updates all parameters of a group in a single
+    kernel. Only supported by some optimizers and for CUDA floating point parameters, and not together with
+    gradient clipping (max_norm)."""
 
     # TODO: somehow make this more generic. i dont like the idea of overriding the setup function
     # but also not sure how to go about passing things into predefined torch objects.
@@ -49,9 +58,33 @@ class OptimizerConfig(base_config.PrintableConfig):
         kwargs = vars(self).copy()
         kwargs.pop("_target")
         kwargs.pop("max_norm")
+        # configs loaded from older config.yml files may lack these fields in their instance dict,
+        # so read them as attributes to fall back to the class defaults
+        kwargs.pop("fused", None)
+        kwargs.pop("foreach", None)
+        params = list(params)
+        if self.fused:
+            if self.max_norm is not None:
+                raise ValueError("Fused optimizers do not support gradient clipping, unset max_norm or fused.")
+            if not _supports_fused(self._target, params):
+                raise ValueError(
+                    f"{self._target.__name__} does not support fused updates of the given parameters, "
+                    "which requires a fused argument and CUDA floating point parameters."
+                )
+            # fused and foreach are mutually exclusive
+            kwargs["fused"] = True
+        elif self.foreach is not None and "foreach" in signature(self._target).parameters:
+            kwargs["foreach"] = self.foreach
         return self._target(params, **kwargs)
 
 
+def _supports_fused(optimizer_class: Type, params: List[Parameter]) -> bool:
+    """Returns whether the fused implementation of the optimizer class can be used for the given parameters."""
+    if "fused" not in signature(optimizer_class).parameters:
+        return False
+    return len(params) > 0 and all(p.is_cuda and torch.is_floating_point(p) for p in params)
+
+
 @dataclass
 class AdamOptimizerConfig(OptimizerConfig):
     """Basic optimizer config with Adam"""
@@ -108,13 +141,18 @@ class Optimizers:
         Args:
             param_group_name: name of scheduler to step forward
         """
-        if self.config.param_group_name.scheduler:  # type: ignore
-            self.schedulers[param_group_name].step()
+        scheduler = self.schedulers.get(param_group_name)
+        if scheduler is not None:
+            scheduler.step()
 
     def zero_grad_all(self) -> None:
-        """Zero the gradients for all optimizer parameters."""
+        """Zero the gradients for all optimizer parameters.
+
+        Gradients are set to None rather than filled with zeros, which skips a memset per parameter. Parameters
+        that receive no gradient in the next backward pass keep a None gradient, so their optimizer is not stepped.
+        """
         for _, optimizer in self.optimizers.items():
-            optimizer.zero_grad()
+            optimizer.zero_grad(set_to_none=True)
 
     def optimizer_scaler_step_all(self, grad_scaler: GradScaler) -> None:
         """Take an optimizer step using a grad scaler.
@@ -145,11 +183,13 @@ class Optimizers:
         Args:
             step: the current step
         """
+        learning_rates = {}
         for param_group_name, scheduler in self.schedulers.items():
             scheduler.step()
-            # TODO(ethan): clean this up. why is there indexing into a list?
-            lr = scheduler.get_last_lr()[0]
-            writer.put_scalar(name=f"learning_rate/{param_group_name}", scalar=lr, step=step)
+            # each optimizer holds a single param group, so there is a single learning rate
+            learning_rates[param_group_name] = scheduler.get_last_lr()[0]
+        if learning_rates:
+            writer.put_dict(name="learning_rate", scalar_dict=learning_rates, step=step)
 
     def load_optimizers(self, loaded_state: Dict[str, Any]) -> None:
         """Helper to load the optimizer state from previous checkpoint
@@ -16,6 +16,7 @@
 
 """Scheduler Classes"""
 
+import math
 from abc import abstractmethod
 from dataclasses import dataclass, field
 from typing import Literal, Optional, Tuple, Type
@@ -114,23 +115,24 @@ class ExponentialDecayScheduler(Scheduler):
         else:
             lr_final = self.config.lr_final
 
+        lr_pre_warmup = self.config.lr_pre_warmup
+        warmup_steps = self.config.warmup_steps
+        decay_steps = self.config.max_steps - warmup_steps
+        cosine_ramp = self.config.ramp == "cosine"
+        # exp(log(lr_init) * (1 - t) + log(lr_final) * t) / lr_init simplifies to (lr_final / lr_init) ** t
+        lr_ratio = lr_final / lr_init
+
         def func(step):
-            if step < self.config.warmup_steps:
-                if self.config.ramp == "cosine":
-                    lr = self.config.lr_pre_warmup + (1 - self.config.lr_pre_warmup) * np.sin(
-                        0.5 * np.pi * np.clip(step / self.config.warmup_steps, 0, 1)
+            if step < warmup_steps:
+                if cosine_ramp:
+                    lr = lr_pre_warmup + (1 - lr_pre_warmup) * math.sin(
+                        0.5 * math.pi * min(max(step / warmup_steps, 0.0), 1.0)
                     )
                 else:
-                    lr = (
-                        self.config.lr_pre_warmup
-                        + (lr_init - self.config.lr_pre_warmup) * step / self.config.warmup_steps
-                    )
-            else:
-                t = np.clip(
-                    (step - self.config.warmup_steps) / (self.config.max_steps - self.config.warmup_steps), 0, 1
-                )
-                lr = np.exp(np.log(lr_init) * (1 - t) + np.log(lr_final) * t)
-            return lr / lr_init  # divided by lr_init because the multiplier is with the initial learning rate
+                    lr = lr_pre_warmup + (lr_init - lr_pre_warmup) * step / warmup_steps
+                return lr / lr_init  # divided by lr_init because the multiplier is with the initial learning rate
+            t = min(max((step - warmup_steps) / decay_steps, 0.0), 1.0)
+            return lr_ratio**t
 
         scheduler = lr_scheduler.LambdaLR(optimizer, lr_lambda=func)
         return scheduler
@@ -20,6 +20,7 @@ from __future__ import annotations
 import dataclasses
 import functools
 import os
+import pickle
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -381,7 +382,9 @@ class Trainer:
             if load_step is None:
                 print("Loading latest Nerfstudio checkpoint from load_dir...")
                 # NOTE: this is specific to the checkpoint name format
-                load_step = sorted(int(x[x.find("-") + 1 : x.find(".")]) for x in os.listdir(load_dir))[-1]
+                load_step = sorted(
+                    int(x[x.find("-") + 1 : x.find(".")]) for x in os.listdir(load_dir) if x.endswith(".ckpt")
+                )[-1]
             load_path: Path = load_dir / f"step-{load_step:09d}.ckpt"
             assert load_path.exists(), f"Checkpoint {load_path} does not exist"
             loaded_state = torch.load(load_path, map_location="cpu")
@@ -415,6 +418,8 @@ class Trainer:
             self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
         # save the checkpoint
         ckpt_path: Path = self.checkpoint_dir / f"step-{step:09d}.ckpt"
+        # write to a temporary file first, so that an interrupted save never leaves a truncated checkpoint behind
+        tmp_ckpt_path = ckpt_path.with_name(ckpt_path.name + ".tmp")
         torch.save(
             {
                 "step": step,
@@ -424,8 +429,10 @@ class Trainer:
                 "optimizers": {k: v.state_dict() for (k, v) in self.optimizers.optimizers.items()},
                 "scalers": self.grad_scaler.state_dict(),
             },
-            ckpt_path,
+            tmp_ckpt_path,
+            pickle_protocol=pickle.HIGHEST_PROTOCOL,
         )
+        os.replace(tmp_ckpt_path, ckpt_path)
         # possibly delete old checkpoints
         if self.config.save_only_latest_checkpoint:
             # delete everything else in the checkpoint folder
@@ -196,15 +196,13 @@ class TSDF:
             [depth_images.shape[-1], depth_images.shape[-2]], device=self.device
         )  # [width, height]
 
-        # make voxel_coords homogeneous
-        voxel_world_coords = self.voxel_coords.view(3, -1)
-        voxel_world_coords = torch.cat(
-            [voxel_world_coords, torch.ones(1, voxel_world_coords.shape[1], device=self.device)], dim=0
-        )
-        voxel_world_coords = voxel_world_coords.unsqueeze(0)  # [1, 4, N]
-        voxel_world_coords = voxel_world_coords.expand(batch_size, *voxel_world_coords.shape[1:])  # [batch, 4, N]
+        voxel_world_coords = self.voxel_coords.view(3, -1)  # [3, N]
 
-        voxel_cam_coords = torch.bmm(torch.inverse(c2w), voxel_world_coords)  # [batch, 4, N]
+        # invert the rigid camera transforms in closed form, [R | t] -> [R^T | -R^T t], and apply them to the voxels
+        # directly instead of padding every voxel with a homogeneous coordinate
+        rotation_inv = c2w[:, :3, :3].transpose(1, 2)  # [batch, 3, 3]
+        translation_inv = -torch.bmm(rotation_inv, c2w[:, :3, 3:4])  # [batch, 3, 1]
+        voxel_cam_coords = torch.matmul(rotation_inv, voxel_world_coords).add_(translation_inv)  # [batch, 3, N]
 
         # flip the z axis
         voxel_cam_coords[:, 2, :] = -voxel_cam_coords[:, 2, :]
@@ -333,8 +331,8 @@ def export_tsdf_mesh(
     c2w = torch.cat([c2w, torch.zeros(c2w.shape[0], 1, 4, device=device)], dim=1)
     c2w[:, 3, 3] = 1
     K: Float[Tensor, "N 3 3"] = cameras.get_intrinsics_matrices().to(device)
-    color_images = torch.tensor(np.array(color_images), device=device).permute(0, 3, 1, 2)  # shape (N, 3, H, W)
-    depth_images = torch.tensor(np.array(depth_images), device=device).permute(0, 3, 1, 2)  # shape (N, 1, H, W)
+    color_images = torch.from_numpy(np.stack(color_images)).to(device).permute(0, 3, 1, 2)  # shape (N, 3, H, W)
+    depth_images = torch.from_numpy(np.stack(depth_images)).to(device).permute(0, 3, 1, 2)  # shape (N, 1, H, W)
 
     CONSOLE.print("Integrating the TSDF")
     for i in range(0, len(c2w), batch_size):
@@ -117,6 +117,10 @@ class NeRFEncoding(Encoding):
         self.min_freq = min_freq_exp
         self.max_freq = max_freq_exp
         self.include_input = include_input
+        freqs = 2 ** torch.linspace(self.min_freq, self.max_freq, self.num_frequencies)
+        self.register_buffer("freqs", freqs, persistent=False)
+        # cos(x) = sin(x + pi / 2), so both halves of the encoding come out of a single broadcast sin
+        self.register_buffer("phases", torch.tensor([[0.0], [torch.pi / 2.0]]), persistent=False)
 
     def get_out_dim(self) -> int:
         if self.in_dim is None:
@@ -140,19 +144,19 @@ class NeRFEncoding(Encoding):
         Returns:
             Output values will be between -1 and 1
         """
-        scaled_in_tensor = 2 * torch.pi * in_tensor  # scale to [0, 2pi]
-        freqs = 2 ** torch.linspace(self.min_freq, self.max_freq, self.num_frequencies).to(in_tensor.device)
-        scaled_inputs = scaled_in_tensor[..., None] * freqs  # [..., "input_dim", "num_scales"]
+        freqs = self.freqs.to(in_tensor.device)
+        # scale to [0, 2pi] together with the frequencies, so the input is only multiplied once
+        scaled_inputs = in_tensor[..., None] * (2 * torch.pi * freqs)  # [..., "input_dim", "num_scales"]
         scaled_inputs = scaled_inputs.view(*scaled_inputs.shape[:-2], -1)  # [..., "input_dim" * "num_scales"]
+        phased_inputs = scaled_inputs[..., None, :] + self.phases.to(in_tensor)  # [..., 2, "input_dim" * "num_scales"]
 
         if covs is None:
-            encoded_inputs = torch.sin(torch.cat([scaled_inputs, scaled_inputs + torch.pi / 2.0], dim=-1))
+            encoded_inputs = torch.sin(phased_inputs).flatten(-2)
         else:
             input_var = torch.diagonal(covs, dim1=-2, dim2=-1)[..., :, None] * freqs[None, :] ** 2
             input_var = input_var.reshape((*input_var.shape[:-2], -1))
-            encoded_inputs = expected_sin(
-                torch.cat([scaled_inputs, scaled_inputs + torch.pi / 2.0], dim=-1), torch.cat(2 * [input_var], dim=-1)
-            )
+            # the sin and cos halves share their variances, so the attenuation is broadcast rather than duplicated
+            encoded_inputs = expected_sin(phased_inputs, input_var[..., None, :]).flatten(-2)
 
         if self.include_input:
             encoded_inputs = torch.cat([encoded_inputs, in_tensor], dim=-1)
@@ -200,16 +204,16 @@ class RFFEncoding(Encoding):
         Returns:
             Output values will be between -1 and 1
         """
-        scaled_in_tensor = 2 * torch.pi * in_tensor  # scale to [0, 2pi]
-        scaled_inputs = scaled_in_tensor @ self.b_matrix  # [..., "num_frequencies"]
+        # scale to [0, 2pi] through the small frequency matrix rather than the whole input batch
+        scaled_inputs = in_tensor @ (2 * torch.pi * self.b_matrix)  # [..., "num_frequencies"]
 
         if covs is None:
             encoded_inputs = torch.sin(torch.cat([scaled_inputs, scaled_inputs + torch.pi / 2.0], dim=-1))
         else:
             input_var = torch.sum((covs @ self.b_matrix) * self.b_matrix, -2)
             encoded_inputs = expected_sin(
-                torch.cat([scaled_inputs, scaled_inputs + torch.pi / 2.0], dim=-1), torch.cat(2 * [input_var], dim=-1)
-            )
+                torch.stack([scaled_inputs, scaled_inputs + torch.pi / 2.0], dim=-2), input_var[..., None, :]
+            ).flatten(-2)
 
         if self.include_input:
             encoded_inputs = torch.cat([encoded_inputs, in_tensor], dim=-1)
@@ -375,11 +379,11 @@ class TensorCPEncoding(Encoding):
         return self.num_components
 
     def forward(self, in_tensor: Float[Tensor, "*bs input_dim"]) -> Float[Tensor, "*bs output_dim"]:
-        line_coord = torch.stack([in_tensor[..., 2], in_tensor[..., 1], in_tensor[..., 0]])  # [3, ...]
-        line_coord = torch.stack([torch.zeros_like(line_coord), line_coord], dim=-1)  # [3, ...., 2]
-
         # Stop gradients from going to sampler
-        line_coord = line_coord.view(3, -1, 1, 2).detach()
+        flat_tensor = in_tensor.detach().reshape(-1, 3)
+        # gather all three axes at once and prepend the zero x-coordinate of the 1D lines
+        line_coord = F.pad(flat_tensor[:, [2, 1, 0]].T[..., None], (1, 0))  # [3, -1, 2]
+        line_coord = line_coord.view(3, -1, 1, 2)
 
         line_features = F.grid_sample(self.line_coef, line_coord, align_corners=True)  # [3, Components, -1, 1]
 
@@ -440,13 +444,13 @@ class TensorVMEncoding(Encoding):
 
         Returns: Encoded position
         """
-        plane_coord = torch.stack([in_tensor[..., [0, 1]], in_tensor[..., [0, 2]], in_tensor[..., [1, 2]]])  # [3,...,2]
-        line_coord = torch.stack([in_tensor[..., 2], in_tensor[..., 1], in_tensor[..., 0]])  # [3, ...]
-        line_coord = torch.stack([torch.zeros_like(line_coord), line_coord], dim=-1)  # [3, ...., 2]
-
         # Stop gradients from going to sampler
-        plane_coord = plane_coord.view(3, -1, 1, 2).detach()
-        line_coord = line_coord.view(3, -1, 1, 2).detach()
+        flat_tensor = in_tensor.detach().reshape(-1, 3)
+        # gather the coordinates of all three planes and lines with one indexing op each
+        plane_coord = flat_tensor[:, [0, 1, 0, 2, 1, 2]].view(-1, 3, 2).transpose(0, 1)  # [3, -1, 2]
+        plane_coord = plane_coord.reshape(3, -1, 1, 2)
+        line_coord = F.pad(flat_tensor[:, [2, 1, 0]].T[..., None], (1, 0))  # [3, -1, 2]
+        line_coord = line_coord.view(3, -1, 1, 2)
 
         plane_features = F.grid_sample(self.plane_coef, plane_coord, align_corners=True)  # [3, Components, -1, 1]
         line_features = F.grid_sample(self.line_coef, line_coord, align_corners=True)  # [3, Components, -1, 1]
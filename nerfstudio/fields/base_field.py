@@ -18,7 +18,7 @@ Base class for the graphs.
 
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import Dict, Optional, Tuple, Type
+from typing import Callable, Dict, Optional, Tuple, Type
 
 import torch
 from jaxtyping import Float, Shaped
@@ -137,3 +137,21 @@ def shift_directions_for_tcnn(directions: Float[Tensor, "*bs 3"]) -> Float[Tenso
         directions: batch of directions
     """
     return (directions + 1.0) / 2.0
+
+
+def encode_directions(
+    direction_encoding: Callable[[Tensor], Tensor], directions: Float[Tensor, "*bs 3"]
+) -> Float[Tensor, "*bs output_dim"]:
+    """Encode directions, evaluating the encoding once per ray when all samples along a ray share a direction.
+
+    Ray samples produced by RayBundle.get_ray_samples broadcast each ray direction over the samples dimension
+    without copying it, so the encoding only needs to be computed for one sample per ray.
+
+    Args:
+        direction_encoding: encoding to apply to the directions
+        directions: batch of directions
+    """
+    if directions.dim() > 2 and directions.shape[-2] > 1 and directions.stride(-2) == 0:
+        encoded_dir = direction_encoding(directions[..., :1, :])
+        return encoded_dir.expand(*directions.shape[:-1], encoded_dir.shape[-1])
+    return direction_encoding(directions)
@@ -32,7 +32,7 @@ from nerfstudio.field_components.field_heads import (
     UncertaintyFieldHead,
 )
 from nerfstudio.field_components.mlp import MLP
-from nerfstudio.fields.base_field import Field
+from nerfstudio.fields.base_field import Field, encode_directions
 
 
 class VanillaNerfWField(Field):
@@ -130,7 +130,7 @@ class VanillaNerfWField(Field):
             Dict[FieldHeadNames, Tensor]: Outputs of the NeRF-W field.
         """
         outputs = {}
-        encoded_dir = self.direction_encoding(ray_samples.frustums.directions)
+        encoded_dir = encode_directions(self.direction_encoding, ray_samples.frustums.directions)
         if ray_samples.camera_indices is None:
             raise AttributeError("Camera indices are not provided.")
         camera_indices = ray_samples.camera_indices.squeeze().to(ray_samples.frustums.origins.device)
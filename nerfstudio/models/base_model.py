@@ -209,7 +209,10 @@ class Model(nn.Module):
         Args:
             loaded_state: dictionary of pre-trained model states
         """
-        state = {key.replace("module.", ""): value for key, value in loaded_state["model"].items()}
+        state = {
+            (key[len("module.") :] if key.startswith("module.") else key): value
+            for key, value in loaded_state["model"].items()
+        }
         self.load_state_dict(state)  # type: ignore
 
     def update_to_step(self, step: int) -> None:
@@ -184,11 +184,19 @@ class SemanticNerfWModel(Model):
             density = field_outputs[FieldHeadNames.DENSITY] + field_outputs[FieldHeadNames.TRANSIENT_DENSITY]
             weights = ray_samples.get_weights(density)
             weights_static = ray_samples.get_weights(field_outputs[FieldHeadNames.DENSITY])
-            rgb_static_component = self.renderer_rgb(rgb=field_outputs[FieldHeadNames.RGB], weights=weights)
-            rgb_transient_component = self.renderer_rgb(
-                rgb=field_outputs[FieldHeadNames.TRANSIENT_RGB], weights=weights
-            )
-            rgb = rgb_static_component + rgb_transient_component
+            if self.config.background_color == "last_sample":
+                # compositing is linear in rgb (including the last-sample background) and both components share
+                # the same weights, so render their sum once
+                rgb = self.renderer_rgb(
+                    rgb=field_outputs[FieldHeadNames.RGB] + field_outputs[FieldHeadNames.TRANSIENT_RGB],
+                    weights=weights,
+                )
+            else:
+                rgb_static_component = self.renderer_rgb(rgb=field_outputs[FieldHeadNames.RGB], weights=weights)
+                rgb_transient_component = self.renderer_rgb(
+                    rgb=field_outputs[FieldHeadNames.TRANSIENT_RGB], weights=weights
+                )
+                rgb = rgb_static_component + rgb_transient_component
         else:
             weights_static = ray_samples.get_weights(field_outputs[FieldHeadNames.DENSITY])
             weights = weights_static
@@ -248,7 +256,7 @@ class SemanticNerfWModel(Model):
             betas = outputs["uncertainty"]
             loss_dict["uncertainty_loss"] = 3 + torch.log(betas).mean()
             loss_dict["density_loss"] = 0.01 * outputs["density_transient"].mean()
-            loss_dict["rgb_loss"] = (((image - outputs["rgb"]) ** 2).sum(-1) / (betas[..., 0] ** 2)).mean()
+            loss_dict["rgb_loss"] = ((image - outputs["rgb"]) / betas).square().sum(-1).mean()
         else:
             loss_dict["rgb_loss"] = self.rgb_loss(image, outputs["rgb"])
 
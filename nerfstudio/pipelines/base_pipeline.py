@@ -145,6 +145,7 @@ class Pipeline(nn.Module):
         return model_outputs, loss_dict, metrics_dict
 
     @profiler.time_function
+    @torch.no_grad()
     def get_eval_loss_dict(self, step: int):
         """This function gets your evaluation loss dict. It needs to get the data
         from the DataManager and feed it to the model's forward function
@@ -209,6 +210,15 @@ class VanillaPipelineConfig(cfg.InstantiateConfig):
     """specifies the datamanager config"""
     model: ModelConfig = ModelConfig()
     """specifies the model config"""
+    ddp_find_unused_parameters: bool = True
+    """Whether DDP traverses the autograd graph every step to find parameters that received no gradient. Disable it
+    for models that use all of their parameters on every step to skip the traversal in multi-gpu training."""
+    ddp_static_graph: bool = False
+    """Whether to tell DDP that the set of used parameters never changes between steps, which lets it fuse and
+    overlap gradient allreduces more aggressively in multi-gpu training."""
+    ddp_gradient_as_bucket_view: bool = False
+    """Whether DDP lets parameter gradients be views into its allreduce buckets, which saves a gradient sized copy
+    and its memory in multi-gpu training. Code that detaches or replaces .grad tensors may not work with it."""
 
 
 class VanillaPipeline(Pipeline):
@@ -256,7 +266,16 @@ class VanillaPipeline(Pipeline):
 
         self.world_size = world_size
         if world_size > 1:
-            self._model = typing.cast(Model, DDP(self._model, device_ids=[local_rank], find_unused_parameters=True))
+            self._model = typing.cast(
+                Model,
+                DDP(
+                    self._model,
+                    device_ids=[local_rank],
+                    find_unused_parameters=config.ddp_find_unused_parameters,
+                    static_graph=config.ddp_static_graph,
+                    gradient_as_bucket_view=config.ddp_gradient_as_bucket_view,
+                ),
+            )
             dist.barrier(device_ids=[local_rank])
 
     @property
@@ -300,6 +319,7 @@ class VanillaPipeline(Pipeline):
         raise NotImplementedError
 
     @profiler.time_function
+    @torch.no_grad()
     def get_eval_loss_dict(self, step: int):
         """This function gets your evaluation loss dict. It needs to get the data
         from the DataManager and feed it to the model's forward function
@@ -316,6 +336,7 @@ class VanillaPipeline(Pipeline):
         return model_outputs, loss_dict, metrics_dict
 
     @profiler.time_function
+    @torch.no_grad()
     def get_eval_image_metrics_and_images(self, step: int):
         """This function gets your evaluation loss dict. It needs to get the data
         from the DataManager and feed it to the model's forward function
@@ -335,6 +356,7 @@ class VanillaPipeline(Pipeline):
         return metrics_dict, images_dict
 
     @profiler.time_function
+    @torch.no_grad()
     def get_average_eval_image_metrics(self, step: Optional[int] = None):
         """Iterate over all the images in the eval dataset and get the average.
 
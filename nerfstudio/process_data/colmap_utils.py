@@ -407,26 +407,29 @@ def colmap_to_json(
     cam_id_to_camera = read_cameras_binary(recon_dir / "cameras.bin")
     im_id_to_image = read_images_binary(recon_dir / "images.bin")
 
-    frames = []
-    for im_id, im_data in im_id_to_image.items():
-        # NB: COLMAP uses Eigen / scalar-first quaternions
-        # * https://colmap.github.io/format.html
-        # * https://github.com/colmap/colmap/blob/bf3e19140f491c3042bfd85b7192ef7d249808ec/src/base/pose.cc#L75
-        # the `rotation_matrix()` handles that format for us.
-
-        # TODO(1480) BEGIN use pycolmap API
-        # rotation = im_data.rotation_matrix()
-        rotation = qvec2rotmat(im_data.qvec)
-
-        translation = im_data.tvec.reshape(3, 1)
-        w2c = np.concatenate([rotation, translation], 1)
-        w2c = np.concatenate([w2c, np.array([[0, 0, 0, 1]])], 0)
-        c2w = np.linalg.inv(w2c)
-        # Convert from COLMAP's camera coordinate system (OpenCV) to ours (OpenGL)
-        c2w[0:3, 1:3] *= -1
-        c2w = c2w[np.array([1, 0, 2, 3]), :]
-        c2w[2, :] *= -1
+    # NB: COLMAP uses Eigen / scalar-first quaternions
+    # * https://colmap.github.io/format.html
+    # * https://github.com/colmap/colmap/blob/bf3e19140f491c3042bfd85b7192ef7d249808ec/src/base/pose.cc#L75
+    # the `rotation_matrix()` handles that format for us.
+
+    # TODO(1480) BEGIN use pycolmap API
+    # rotations = np.stack([im_data.rotation_matrix() for im_data in im_id_to_image.values()])
+    rotations = qvec2rotmat(np.array([im_data.qvec for im_data in im_id_to_image.values()]).reshape(-1, 4))
+    translations = np.array([im_data.tvec for im_data in im_id_to_image.values()]).reshape(-1, 3)
+
+    # Invert all world-to-camera transforms at once, using the closed form inverse of a rigid transform.
+    rotations_t = np.swapaxes(rotations, -1, -2)
+    c2ws = np.zeros((len(rotations), 4, 4))
+    c2ws[:, :3, :3] = rotations_t
+    c2ws[:, :3, 3] = -np.einsum("bij,bj->bi", rotations_t, translations)
+    c2ws[:, 3, 3] = 1.0
+    # Convert from COLMAP's camera coordinate system (OpenCV) to ours (OpenGL)
+    c2ws[:, 0:3, 1:3] *= -1
+    c2ws = c2ws[:, np.array([1, 0, 2, 3]), :]
+    c2ws[:, 2, :] *= -1
 
+    frames = []
+    for (im_id, im_data), c2w in zip(im_id_to_image.items(), c2ws):
         name = im_data.name
         if image_rename_map is not None:
             name = image_rename_map[name]
@@ -528,13 +531,14 @@ def create_sfm_depth(
     image_id_to_depth_path = {}
     for im_id, im_data in iter_images:
         # TODO(1480) BEGIN delete when abandoning colmap_parsing_utils
-        pids = [pid for pid in im_data.point3D_ids if pid != -1]
-        xyz_world = np.array([ptid_to_info[pid].xyz for pid in pids])
+        triangulated = im_data.point3D_ids != -1
+        points = [ptid_to_info[pid] for pid in im_data.point3D_ids[triangulated]]
+        xyz_world = np.array([point.xyz for point in points]).reshape(-1, 3)
         rotation = qvec2rotmat(im_data.qvec)
         z = (rotation @ xyz_world.T)[-1] + im_data.tvec[-1]
-        errors = np.array([ptid_to_info[pid].error for pid in pids])
-        n_visible = np.array([len(ptid_to_info[pid].image_ids) for pid in pids])
-        uv = np.array([im_data.xys[i] for i in range(len(im_data.xys)) if im_data.point3D_ids[i] != -1])
+        errors = np.array([point.error for point in points])
+        n_visible = np.array([len(point.image_ids) for point in points])
+        uv = im_data.xys[triangulated]
         # TODO(1480) END delete when abandoning colmap_parsing_utils
 
         # TODO(1480) BEGIN use pycolmap API
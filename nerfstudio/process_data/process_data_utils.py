@@ -14,6 +14,8 @@
 
 """Helper utils for processing data into the nerfstudio format."""
 
+import concurrent.futures
+import functools
 import math
 import os
 import shutil
@@ -54,8 +56,13 @@ def list_images(data: Path) -> List[Path]:
     Returns:
         Paths to images contained in the directory
     """
-    allowed_exts = [".jpg", ".jpeg", ".png", ".tif", ".tiff"]
-    image_paths = sorted([p for p in data.glob("[!.]*") if p.suffix.lower() in allowed_exts])
+    allowed_exts = (".jpg", ".jpeg", ".png", ".tif", ".tiff")
+    with os.scandir(data) as entries:
+        image_paths = sorted(
+            Path(entry.path)
+            for entry in entries
+            if not entry.name.startswith(".") and entry.name.lower().endswith(allowed_exts)
+        )
     return image_paths
 
 
@@ -76,7 +83,7 @@ def get_image_filenames(directory: Path, max_num_images: int = -1) -> Tuple[List
     else:
         idx = np.arange(num_orig_images)
 
-    image_filenames = list(np.array(image_paths)[idx])
+    image_filenames = [image_paths[i] for i in idx]
 
     return image_filenames, num_orig_images
 
@@ -337,26 +344,28 @@ def downscale_images(
         return "No downscaling performed."
 
     with status(msg="[bold yellow]Downscaling images...", spinner="growVertical", verbose=verbose):
+        # Using %05d ffmpeg commands appears to be unreliable (skips images), so use scandir.
+        with os.scandir(image_dir) as entries:
+            filenames = [entry.name for entry in entries if not entry.is_dir()]
+        nn_flag = "" if not nearest_neighbor else ":flags=neighbor"
         downscale_factors = [2**i for i in range(num_downscales + 1)[1:]]
+        ffmpeg_cmds = []
         for downscale_factor in downscale_factors:
             assert downscale_factor > 1
             assert isinstance(downscale_factor, int)
             downscale_dir = image_dir.parent / f"{folder_name}_{downscale_factor}"
             downscale_dir.mkdir(parents=True, exist_ok=True)
-            # Using %05d ffmpeg commands appears to be unreliable (skips images), so use scandir.
-            files = os.scandir(image_dir)
-            for f in files:
-                if f.is_dir():
-                    continue
-                filename = f.name
-                nn_flag = "" if not nearest_neighbor else ":flags=neighbor"
+            for filename in filenames:
                 ffmpeg_cmd = [
                     f'ffmpeg -y -noautorotate -i "{image_dir / filename}" ',
                     f"-q:v 2 -vf scale=iw/{downscale_factor}:ih/{downscale_factor}{nn_flag} ",
                     f'"{downscale_dir / filename}"',
                 ]
-                ffmpeg_cmd = " ".join(ffmpeg_cmd)
-                run_command(ffmpeg_cmd, verbose=verbose)
+                ffmpeg_cmds.append(" ".join(ffmpeg_cmd))
+
+        # Each command is a separate ffmpeg process, so they can run concurrently.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(functools.partial(run_command, verbose=verbose), ffmpeg_cmds))
 
     CONSOLE.log("[bold green]:tada: Done downscaling images.")
     downscale_text = [f"[bold blue]{2**(i+1)}x[/bold blue]" for i in range(num_downscales)]
@@ -86,7 +86,7 @@ class ProcessRecord3D(BaseConverterToNerfstudioDataset):
         if self.max_dataset_size != -1 and num_images > self.max_dataset_size:
             idx = np.round(np.linspace(0, num_images - 1, self.max_dataset_size)).astype(int)
 
-        record3d_image_filenames = list(np.array(record3d_image_filenames)[idx])
+        record3d_image_filenames = [record3d_image_filenames[i] for i in idx]
         # Copy images to output directory
         copied_image_paths = process_data_utils.copy_images_list(
             record3d_image_filenames, image_dir=image_dir, verbose=self.verbose
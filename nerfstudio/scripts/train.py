@@ -45,6 +45,7 @@ subcommand:
 
 from __future__ import annotations
 
+import os
 import random
 import socket
 import traceback
@@ -70,12 +71,11 @@ DEFAULT_TIMEOUT = timedelta(minutes=30)
 torch.backends.cudnn.benchmark = True  # type: ignore
 
 
-def _find_free_port() -> str:
+def _find_free_port() -> int:
     """Finds a free port."""
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.bind(("", 0))
-    port = sock.getsockname()[1]
-    sock.close()
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("", 0))
+        port = sock.getsockname()[1]
     return port
 
 
@@ -141,15 +141,23 @@ def _distributed_worker(
         rank=global_rank,
         timeout=timeout,
     )
+    # bind this process to its own GPU before any group creation or CUDA work, otherwise every rank
+    # creates a context on (and runs default-device kernels on) GPU 0
+    assert num_gpus_per_machine <= torch.cuda.device_count()
+    torch.cuda.set_device(local_rank)
     assert comms.LOCAL_PROCESS_GROUP is None
     num_machines = world_size // num_gpus_per_machine
-    for i in range(num_machines):
-        ranks_on_i = list(range(i * num_gpus_per_machine, (i + 1) * num_gpus_per_machine))
-        pg = dist.new_group(ranks_on_i)
-        if i == machine_rank:
-            comms.LOCAL_PROCESS_GROUP = pg
+    if num_machines == 1:
+        # the only machine holds every rank, so the default group already is the local group
+        comms.LOCAL_PROCESS_GROUP = dist.group.WORLD
+    else:
+        # new_group is collective, so every rank has to create every machine's group in the same order
+        for i in range(num_machines):
+            ranks_on_i = list(range(i * num_gpus_per_machine, (i + 1) * num_gpus_per_machine))
+            pg = dist.new_group(ranks_on_i)
+            if i == machine_rank:
+                comms.LOCAL_PROCESS_GROUP = pg
 
-    assert num_gpus_per_machine <= torch.cuda.device_count()
     output = main_func(local_rank, world_size, config, global_rank)
     comms.synchronize()
     dist.destroy_process_group()
@@ -177,6 +185,9 @@ def launch(
         timeout (timedelta, optional): timeout of the distributed workers.
     """
     assert config is not None
+    # limit caching allocator fragmentation from the varying ray and chunk sizes, unless the user configured it;
+    # only read at the first CUDA allocation, and inherited by the spawned distributed workers
+    os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "max_split_size_mb:512")
     world_size = num_machines * num_gpus_per_machine
     if world_size <= 1:
         # world_size=0 uses one CPU in one process.
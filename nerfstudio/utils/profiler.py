@@ -63,7 +63,7 @@ class time_function(ContextDecorator):  # pylint: disable=invalid-name
         raise ValueError(f"Argument func of type {type(func)} is not a string or a callable.")
 
     def __enter__(self):
-        self.start = time.time()
+        self.start = time.perf_counter_ns()
         if PYTORCH_PROFILER is not None:
             args, kwargs = tuple(), {}
             if self._function_call_args is not None:
@@ -81,11 +81,14 @@ class time_function(ContextDecorator):  # pylint: disable=invalid-name
             context = self._profiler_contexts.pop()
             context.__exit__(*args, **kwargs)
         if PROFILER:
-            PROFILER[0].update_time(self.name, self.start, time.time())
+            PROFILER[0].update_time(self.name, self.start, time.perf_counter_ns())
 
     def __call__(self, func: Callable):
         @functools.wraps(func)
         def inner(*args, **kwargs):
+            if not PROFILER and PYTORCH_PROFILER is None:
+                # no profiler is set up (--logging.profiler none, or a non-main rank), skip the timing bookkeeping
+                return func(*args, **kwargs)
             self._function_call_args = (args, kwargs)
             with self:
                 out = func(*args, **kwargs)
@@ -104,7 +107,7 @@ def flush_profiler(config: cfg.LoggingConfig):
 def setup_profiler(config: cfg.LoggingConfig, log_dir: Path):
     """Initialization of profilers"""
     global PYTORCH_PROFILER  # pylint: disable=global-statement
-    if comms.is_main_process():
+    if comms.is_main_process() and config.profiler != "none":
         PROFILER.append(Profiler(config))
         if config.profiler == "pytorch":
             PYTORCH_PROFILER = PytorchProfiler(log_dir)
@@ -164,30 +167,28 @@ class Profiler:
 
     def __init__(self, config: cfg.LoggingConfig):
         self.config = config
-        self.profiler_dict = {}
+        self.profiler_dict: Dict[str, List[int]] = {}
 
-    def update_time(self, func_name: str, start_time: float, end_time: float):
-        """update the profiler dictionary with running averages of durations
+    def update_time(self, func_name: str, start_time: int, end_time: int):
+        """update the profiler dictionary with the total duration and number of calls
 
         Args:
             func_name: the function name that is being profiled
-            start_time: the start time when function is called
-            end_time: the end time when function terminated
+            start_time: the start time in nanoseconds when function is called
+            end_time: the end time in nanoseconds when function terminated
         """
-        val = end_time - start_time
-        func_dict = self.profiler_dict.get(func_name, {"val": 0, "step": 0})
-        prev_val = func_dict["val"]
-        prev_step = func_dict["step"]
-        self.profiler_dict[func_name] = {"val": (prev_val * prev_step + val) / (prev_step + 1), "step": prev_step + 1}
+        entry = self.profiler_dict.get(func_name)
+        if entry is None:
+            self.profiler_dict[func_name] = [end_time - start_time, 1]
+        else:
+            entry[0] += end_time - start_time
+            entry[1] += 1
 
     def print_profile(self):
         """helper to print out the profiler stats"""
         CONSOLE.print("Printing profiling stats, from longest to shortest duration in seconds")
-        sorted_keys = sorted(
-            self.profiler_dict.keys(),
-            key=lambda k: self.profiler_dict[k]["val"],
-            reverse=True,
-        )
+        averages = {k: total_ns / count * 1e-9 for k, (total_ns, count) in self.profiler_dict.items()}
+        sorted_keys = sorted(averages.keys(), key=lambda k: averages[k], reverse=True)
         for k in sorted_keys:
-            val = f"{self.profiler_dict[k]['val']:0.4f}"
+            val = f"{averages[k]:0.4f}"
             CONSOLE.print(f"{k:<20}: {val:<20}")
@@ -117,9 +117,9 @@ def find_available_port(func: Callable, default_port: int, max_attempts: int = 1
         port = default_port + i
         try:
             return func(port, **kwargs), port
-        except Exception as e:
-            print(type(e))
-            raise
+        except OSError:
+            # port is already in use, try the next one
+            continue
     raise (
         Exception(f"Could not find an available port in the range: [{default_port:d}, {max_attempts + default_port:d})")
     )
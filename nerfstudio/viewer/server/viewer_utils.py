@@ -77,14 +77,13 @@ def is_port_open(port: int):
     Returns:
         True if the port is open, False otherwise.
     """
-    try:
-        sock = socket.socket()
+    with socket.socket() as sock:
         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        _ = sock.bind(("", port))
-        sock.close()
-        return True
-    except OSError:
-        return False
+        try:
+            sock.bind(("", port))
+        except OSError:
+            return False
+    return True
 
 
 def get_free_port(default_port: Optional[int] = None):
@@ -99,9 +98,9 @@ def get_free_port(default_port: Optional[int] = None):
     if default_port is not None:
         if is_port_open(default_port):
             return default_port
-    sock = socket.socket()
-    sock.bind(("", 0))
-    port = sock.getsockname()[1]
+    with socket.socket() as sock:
+        sock.bind(("", 0))
+        port = sock.getsockname()[1]
     return port
 
 
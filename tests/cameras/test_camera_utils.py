@@ -0,0 +1,92 @@
+"""
+Test camera utils
+"""
+
+import numpy as np
+import torch
+
+from nerfstudio.cameras import camera_utils
+
+
+def _random_pose(rng: np.random.Generator) -> np.ndarray:
+    """Returns a random 4x4 rigid transform."""
+    quat = rng.normal(size=4)
+    pose = camera_utils.quaternion_matrix(quat)
+    pose[:3, 3] = rng.normal(size=3)
+    return pose
+
+
+def test_get_interpolated_poses():
+    """Test that batched pose interpolation matches per-step slerp."""
+    rng = np.random.default_rng(0)
+    steps = 7
+    for _ in range(10):
+        pose_a = _random_pose(rng)
+        pose_b = _random_pose(rng)
+        poses_ab = camera_utils.get_interpolated_poses(pose_a, pose_b, steps=steps)
+        assert poses_ab.shape == (steps, 3, 4)
+
+        quat_a = camera_utils.quaternion_from_matrix(pose_a[:3, :3])
+        quat_b = camera_utils.quaternion_from_matrix(pose_b[:3, :3])
+        for i, t in enumerate(np.linspace(0, 1, steps)):
+            quat = camera_utils.quaternion_slerp(quat_a, quat_b, t)
+            rot = camera_utils.quaternion_matrix(quat)[:3, :3]
+            tran = (1 - t) * pose_a[:3, 3] + t * pose_b[:3, 3]
+            assert np.allclose(poses_ab[i, :3, :3], rot)
+            assert np.allclose(poses_ab[i, :3, 3], tran)
+
+    # Interpolating a pose with itself should return the pose at every step.
+    poses_aa = camera_utils.get_interpolated_poses(pose_a, pose_a, steps=steps)
+    assert np.allclose(poses_aa, pose_a[None, :3])
+
+
+def test_get_interpolated_poses_many():
+    """Test that batched interpolation over many poses matches pairwise interpolation."""
+    rng = np.random.default_rng(0)
+    num_poses, steps = 5, 4
+    poses = torch.from_numpy(np.stack([_random_pose(rng)[:3] for _ in range(num_poses)])).float()
+    Ks = torch.rand((num_poses, 3, 3))
+
+    traj, k_interp = camera_utils.get_interpolated_poses_many(poses, Ks, steps_per_transition=steps)
+    assert traj.shape == ((num_poses - 1) * steps, 3, 4)
+    assert k_interp.shape == ((num_poses - 1) * steps, 3, 3)
+
+    for idx in range(num_poses - 1):
+        poses_ab = camera_utils.get_interpolated_poses(poses[idx].numpy(), poses[idx + 1].numpy(), steps=steps)
+        ks_ab = torch.stack(camera_utils.get_interpolated_k(Ks[idx], Ks[idx + 1], steps=steps))
+        assert np.allclose(traj[idx * steps : (idx + 1) * steps].numpy(), poses_ab, atol=1e-6)
+        assert torch.allclose(k_interp[idx * steps : (idx + 1) * steps], ks_ab)
+
+
+def test_quaternion_from_matrix():
+    """Test that both quaternion conversion paths recover the generating quaternion."""
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        quat = rng.normal(size=4)
+        quat /= np.linalg.norm(quat)
+        quat = quat if quat[0] >= 0 else -quat
+        matrix = camera_utils.quaternion_matrix(quat)
+        assert np.allclose(camera_utils.quaternion_from_matrix(matrix), quat)
+        assert np.allclose(camera_utils.quaternion_from_matrix(matrix, isprecise=True), quat)
+        assert np.allclose(camera_utils.quaternion_from_matrix(matrix[:3, :3], isprecise=True), quat)
+
+
+
+def test_radial_and_tangential_undistort():
+    """Test that undistorted coords map back to the distorted ones, and that undistorted coords stay fixed."""
+    generator = torch.Generator().manual_seed(0)
+    coords = torch.rand((3, 64, 2), generator=generator) - 0.5
+    distortion_params = 0.05 * torch.randn((64, 6), generator=generator)
+    # zero distortion converges on the first step and must not move afterwards
+    distortion_params[:8] = 0.0
+
+    undistorted = camera_utils.radial_and_tangential_undistort(coords, distortion_params)
+    assert undistorted.shape == coords.shape
+    assert torch.equal(undistorted[:, :8], coords[:, :8])
+
+    k1, k2, k3, k4, p1, p2 = distortion_params.unbind(-1)
+    fx, fy, *_ = camera_utils._compute_residual_and_jacobian(  # pylint: disable=protected-access
+        undistorted[..., 0], undistorted[..., 1], coords[..., 0], coords[..., 1], k1, k2, k3, k4, p1, p2
+    )
+    assert torch.allclose(fx, torch.zeros_like(fx), atol=1e-5)
+    assert torch.allclose(fy, torch.zeros_like(fy), atol=1e-5)
@@ -5,7 +5,7 @@ Test the ray classes.
 import pytest
 import torch
 
-from nerfstudio.cameras.rays import Frustums
+from nerfstudio.cameras.rays import Frustums, RayBundle
 
 
 def test_frustum_get_position():
@@ -71,5 +71,22 @@ def test_get_mock_frustum():
     Frustums.get_mock_frustum()
 
 
+def test_ray_bundle_sample():
+    """Test sampling a subset of rays"""
+    ray_bundle = RayBundle(
+        origins=torch.arange(24, dtype=torch.float32).reshape(2, 4, 3),
+        directions=torch.ones((2, 4, 3)),
+        pixel_area=torch.ones((2, 4, 1)),
+    )
+    ray_bundle.set_camera_indices(camera_index=2)
+
+    sampled = ray_bundle.sample(5)
+    assert sampled.shape == (5,)
+    assert sampled.camera_indices is not None
+    assert torch.all(sampled.camera_indices == 2)
+    # Rays are drawn without replacement.
+    assert torch.unique(sampled.origins, dim=0).shape[0] == 5
+
+
 if __name__ == "__main__":
     test_frustum_get_gaussian_blob()
@@ -0,0 +1,40 @@
+"""
+Test optimizer configs
+"""
+import pytest
+import torch
+
+from nerfstudio.engine.optimizers import AdamOptimizerConfig, OptimizerConfig
+
+
+def test_setup_from_config_without_new_fields():
+    """Configs restored from an older config.yml skip __init__ and may lack the fused/foreach fields."""
+    config = AdamOptimizerConfig(lr=1e-3)
+    # mimic yaml.load, which restores the instance dict without running __init__
+    del config.__dict__["fused"]
+    del config.__dict__["foreach"]
+
+    params = [torch.nn.Parameter(torch.zeros(3))]
+    optimizer = config.setup(params=params)
+
+    assert isinstance(optimizer, torch.optim.Adam)
+    assert optimizer.param_groups[0]["lr"] == 1e-3
+    assert not optimizer.defaults.get("fused", False)
+
+
+def test_fused_with_max_norm_raises():
+    """Fused optimizers are opt-in and cannot be combined with gradient clipping."""
+    config = AdamOptimizerConfig(lr=1e-3, max_norm=1.0, fused=True)
+    with pytest.raises(ValueError):
+        config.setup(params=[torch.nn.Parameter(torch.zeros(3))])
+
+
+def test_foreach_only_passed_when_supported():
+    """The foreach setting is forwarded to optimizers that accept it and skipped for the rest."""
+    params = [torch.nn.Parameter(torch.zeros(3))]
+    optimizer = AdamOptimizerConfig(lr=1e-3, foreach=False).setup(params=params)
+    assert optimizer.defaults["foreach"] is False
+
+    # SparseAdam does not take a foreach argument
+    config = OptimizerConfig(_target=torch.optim.SparseAdam, lr=1e-3, foreach=True)
+    assert isinstance(config.setup(params=params), torch.optim.SparseAdam)